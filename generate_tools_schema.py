@@ -0,0 +1,364 @@
+"""Generate tools_schema.json from the compact tool table below.
+
+Each entry in the shipped schema is the same boilerplate wrapper
+({"type": "function", "function": {... "additionalProperties": False,
+"strict": False}}) around a name, a description, a parameter list, and the
+required names. Editing 28 copies of that wrapper by hand is error-prone, so
+the table here is the source of truth: run `python generate_tools_schema.py`
+to rematerialize the JSON asset that tool_usage.get_tools() loads.
+"""
+import json
+from pathlib import Path
+
+def _param(name, type_, description=None, enum=None, items=None):
+    prop = {"type": type_}
+    if enum is not None:
+        prop["enum"] = list(enum)
+    if items is not None:
+        prop["items"] = items
+    if description is not None:
+        prop["description"] = description
+    return name, prop
+
+# Closed vocabularies, named once. The schema dicts get fresh lists built from
+# these tuples (JSON schema wants arrays), so extending a vocabulary is a
+# one-line change here rather than a hunt through the table below.
+_ISSUE_STATUSES = ('in_progress', 'resolved', 'planned', 'blocked')
+_LANGUAGES = ('python', 'typescript', 'yaml', 'markdown', 'json', 'shell', 'sql')
+_EXTENSIONS = ('.pdf', '.md', '.py', '.yml', '.txt', '.png', '.tar.gz', '.xlsx', '.json', '.env', '.html')
+_CUISINES = ('american', 'italian', 'indian', 'coffee', 'mexican', 'french', 'seafood', 'chinese', 'burmese', 'fusion', 'greek')
+_AREAS = ('downtown', 'berkeley', 'mission', 'north_beach', 'marina', 'castro', 'sunset', 'haight', 'palo_alto', 'chinatown')
+_DIETARY = ('vegetarian', 'vegan_options', 'gluten_free', 'halal', 'organic')
+_SERVICES = ('auth-service', 'monitoring-service', 'database', 'api-gateway', 'load-balancer', 'redis-cache', 'payment-service', 'user-service')
+_LOG_LEVELS = ('ERROR', 'CRITICAL', 'INFO', 'WARN', 'DEBUG')
+_EXPENSE_CATEGORIES = ('alerts', 'transportation', 'infrastructure', 'meals', 'office', 'consulting', 'software')
+_CARD_TYPES = ('corporate', 'personal')
+
+# The ISO start/end pair recurs across every time-range tool with only the
+# noun and examples varying; build both properties from one definition, the
+# builder-side equivalent of a JSON-Schema $defs/$ref (the LLM tool-call API
+# takes fully expanded schemas only).
+def _timeframe_params(noun='timestamp', start_example='2024-01-15T09:00:00Z',
+                      end_example='2024-01-15T18:00:00Z'):
+    return [
+        _param('start_time', 'string', f'Start {noun} in ISO format (e.g., {start_example})'),
+        _param('end_time', 'string', f'End {noun} in ISO format (e.g., {end_example})'),
+    ]
+
+_TOOL_TABLE = [
+    (
+        'search_code_issues',
+        'Search through code issues and bug reports by keywords, status, or assignee',
+        [
+            _param('query', 'string', 'Search term to look for in issue titles and discussions'),
+            _param('status', 'string', 'Filter by issue status', enum=_ISSUE_STATUSES),
+            _param('assignee', 'string', 'Filter by person assigned to the issue'),
+        ],
+        ['query'],
+    ),
+    (
+        'get_issue_by_id',
+        'Get detailed information about a specific issue by its ID',
+        [
+            _param('issue_id', 'string', 'The unique ID of the issue (e.g., context_001)'),
+        ],
+        ['issue_id'],
+    ),
+    (
+        'get_issues_by_ids',
+        'Get multiple issues by their IDs in a single call',
+        [
+            _param('issue_ids', 'array', 'The unique IDs of the issues (e.g., context_001)', items={'type': 'string'}),
+        ],
+        ['issue_ids'],
+    ),
+    (
+        'get_issues_by_location',
+        'Find all issues related to a specific file or code location',
+        [
+            _param('file_path', 'string', 'File path or partial path to search for (e.g., jwt_handler.py or /src/auth/)'),
+        ],
+        ['file_path'],
+    ),
+    (
+        'search_emails',
+        'Search through emails by subject, body content, sender, or read status',
+        [
+            _param('query', 'string', 'Search term to look for in email subjects and body content'),
+            _param('sender', 'string', 'Filter by email sender (partial match)'),
+            _param('read_status', 'boolean', 'Filter by read status (true for read, false for unread)'),
+        ],
+        ['query'],
+    ),
+    (
+        'get_email_by_id',
+        'Get detailed information about a specific email by its ID',
+        [
+            _param('email_id', 'string', 'The unique ID of the email (e.g., email_001)'),
+        ],
+        ['email_id'],
+    ),
+    (
+        'get_emails_by_ids',
+        'Get multiple emails by their IDs in a single call',
+        [
+            _param('email_ids', 'array', 'The unique IDs of the emails (e.g., email_001)', items={'type': 'string'}),
+        ],
+        ['email_ids'],
+    ),
+    (
+        'get_emails_by_sender',
+        'Get all emails from a specific sender',
+        [
+            _param('sender', 'string', 'Email address or name of the sender'),
+        ],
+        ['sender'],
+    ),
+    (
+        'search_repo_files',
+        'Search repository files by path, language, or contributor',
+        [
+            _param('query', 'string', 'Search term to look for in file paths'),
+            _param('language', 'string', 'Filter by programming language', enum=_LANGUAGES),
+            _param('contributor', 'string', 'Filter by contributor name'),
+        ],
+        ['query'],
+    ),
+    (
+        'get_file_by_path',
+        'Get detailed information about a specific file by its path',
+        [
+            _param('file_path', 'string', 'File path to search for (e.g., jwt_handler.py or /src/auth/)'),
+        ],
+        ['file_path'],
+    ),
+    (
+        'search_dependencies',
+        'Find dependency information by package name',
+        [
+            _param('package_name', 'string', 'Name of the package/dependency to search for'),
+        ],
+        ['package_name'],
+    ),
+    (
+        'search_local_files',
+        'Search local filesystem files by path, extension, or directory',
+        [
+            _param('query', 'string', 'Search term to look for in file paths'),
+            _param('extension', 'string', 'Filter by file extension', enum=_EXTENSIONS),
+            _param('directory', 'string', 'Filter by directory path (e.g., Downloads, Documents, Code)'),
+        ],
+        ['query'],
+    ),
+    (
+        'get_local_file_by_path',
+        'Get detailed information about a specific local file by its path',
+        [
+            _param('file_path', 'string', 'Local file path to search for'),
+        ],
+        ['file_path'],
+    ),
+    (
+        'get_directory_info',
+        'Get information about a specific directory including file count and size',
+        [
+            _param('dir_path', 'string', 'Directory path to get information for'),
+        ],
+        ['dir_path'],
+    ),
+    (
+        'search_restaurants',
+        'Search restaurants by cuisine, area, or dietary restrictions',
+        [
+            _param('cuisine', 'string', 'Filter by cuisine type', enum=_CUISINES),
+            _param('area', 'string', 'Filter by area/neighborhood', enum=_AREAS),
+            _param('dietary', 'string', 'Filter by dietary options', enum=_DIETARY),
+        ],
+        [],
+    ),
+    (
+        'get_restaurant_by_id',
+        'Get detailed information about a specific restaurant by its ID',
+        [
+            _param('restaurant_id', 'string', 'The unique ID of the restaurant (e.g., rest_001)'),
+        ],
+        ['restaurant_id'],
+    ),
+    (
+        'find_restaurants_by_distance',
+        'Find restaurants within a specific distance, sorted by proximity',
+        [
+            _param('max_distance_km', 'number', 'Maximum distance in kilometers'),
+        ],
+        ['max_distance_km'],
+    ),
+    (
+        'search_system_logs',
+        'Search system logs by service, log level, or error code',
+        [
+            _param('service', 'string', 'Filter by service name', enum=_SERVICES),
+            _param('level', 'string', 'Filter by log level', enum=_LOG_LEVELS),
+            _param('error_code', 'string', 'Filter by specific error code'),
+        ],
+        [],
+    ),
+    (
+        'get_metrics_by_service',
+        'Get performance metrics for a specific service',
+        [
+            _param('service', 'string', 'Service name to get metrics for'),
+        ],
+        ['service'],
+    ),
+    (
+        'get_logs_by_timeframe',
+        'Get logs within a specific time range',
+        [
+            *_timeframe_params(),
+        ],
+        ['start_time', 'end_time'],
+    ),
+    (
+        'search_transactions',
+        'Search financial transactions by category, employee, or card type',
+        [
+            _param('category', 'string', 'Filter by transaction category', enum=_EXPENSE_CATEGORIES),
+            _param('employee', 'string', 'Filter by employee name'),
+            _param('card_type', 'string', 'Filter by card type', enum=_CARD_TYPES),
+        ],
+        [],
+    ),
+    (
+        'get_transaction_by_id',
+        'Get detailed information about a specific transaction by its ID',
+        [
+            _param('transaction_id', 'string', 'The unique ID of the transaction (e.g., TXN-20240115-0001)'),
+        ],
+        ['transaction_id'],
+    ),
+    (
+        'get_transactions_by_ids',
+        'Get multiple transactions by their IDs in a single call',
+        [
+            _param('transaction_ids', 'array', 'The unique IDs of the transactions (e.g., TXN-20240115-0001)', items={'type': 'string'}),
+        ],
+        ['transaction_ids'],
+    ),
+    (
+        'get_expenses_by_timeframe',
+        'Get all expenses within a specific time range',
+        [
+            *_timeframe_params(),
+        ],
+        ['start_time', 'end_time'],
+    ),
+    (
+        'search_calendar_events',
+        'Search calendar events by title, location, or attendee',
+        [
+            _param('query', 'string', 'Search term to look for in event titles and descriptions'),
+            _param('attendee', 'string', 'Filter by attendee email or name'),
+            _param('location', 'string', 'Filter by location (partial match)'),
+        ],
+        ['query'],
+    ),
+    (
+        'get_calendar_by_date',
+        'Get all calendar events for a specific date',
+        [
+            _param('date', 'string', 'Date in ISO format (e.g., 2024-01-15)'),
+        ],
+        ['date'],
+    ),
+    (
+        'check_time_availability',
+        'Check if a specific time slot is free',
+        [
+            *_timeframe_params('time', '2024-01-15T14:00:00Z', '2024-01-15T15:00:00Z'),
+        ],
+        ['start_time', 'end_time'],
+    ),
+    (
+        'get_calendar_event_by_id',
+        'Get detailed information about a specific calendar event by its ID',
+        [
+            _param('event_id', 'string', 'The unique ID of the calendar event (e.g., cal_event_001)'),
+        ],
+        ['event_id'],
+    ),
+    (
+        'get_events_by_timeframe',
+        'Get all calendar events within a specific time range',
+        [
+            *_timeframe_params(),
+        ],
+        ['start_time', 'end_time'],
+    ),
+    (
+        'create_calendar_event',
+        'Create a new calendar event and add it to the calendar',
+        [
+            _param('title', 'string', 'Event title'),
+            _param('description', 'string', 'Event description'),
+            *_timeframe_params('time', '2024-01-15T14:00:00Z', '2024-01-15T15:00:00Z'),
+            _param('location', 'string', 'Event location (optional)'),
+            _param('attendees', 'array', 'List of attendees', items={'type': 'object', 'properties': {'email': {'type': 'string'}, 'name': {'type': 'string'}}}),
+        ],
+        ['title', 'start_time', 'end_time'],
+    ),
+    (
+        'create_calendar_events',
+        'Create multiple calendar events in one call with a single calendar write',
+        [
+            _param('events_to_create', 'array', 'Event specs, each with title, start_time and end_time plus optional description, location and attendees',
+                   items={'type': 'object', 'properties': {
+                       'title': {'type': 'string'},
+                       'description': {'type': 'string'},
+                       'start_time': {'type': 'string'},
+                       'end_time': {'type': 'string'},
+                       'location': {'type': 'string'},
+                       'attendees': {'type': 'array', 'items': {'type': 'object', 'properties': {'email': {'type': 'string'}, 'name': {'type': 'string'}}}},
+                   }}),
+        ],
+        ['events_to_create'],
+    ),
+    (
+        'find_free_time_slots',
+        'Find available time slots within a date range',
+        [
+            _param('start_date', 'string', 'Start date in ISO format (e.g., 2024-01-15)'),
+            _param('end_date', 'string', 'End date in ISO format (e.g., 2024-01-20)'),
+            _param('duration_minutes', 'integer', 'Required duration in minutes (e.g., 60)'),
+            _param('working_hours_only', 'boolean', 'Only show slots during working hours (9 AM - 6 PM)'),
+        ],
+        ['start_date', 'end_date', 'duration_minutes'],
+    ),
+]
+
+def build_tools():
+    tools = []
+    for name, description, params, required in _TOOL_TABLE:
+        tools.append({
+            "type": "function",
+            "function": {
+                "name": name,
+                "description": description,
+                "parameters": {
+                    "type": "object",
+                    "properties": dict(params),
+                    "required": required,
+                    "additionalProperties": False
+                },
+                "strict": False
+            }
+        })
+    return tools
+
+def main():
+    path = Path(__file__).with_name("tools_schema.json")
+    with open(path, "w") as f:
+        json.dump(build_tools(), f, indent=2)
+    print(f"Wrote {len(_TOOL_TABLE)} tool schemas to {path}")
+
+if __name__ == "__main__":
+    main()
@@ -3,18 +3,32 @@ from fastapi import WebSocket
 from typing import Dict, Set, List
 import json
 import asyncio
+import sys
 from datetime import datetime
 from .models import *
 
+_SHARD_COUNT = 16  # power of two so shard selection is a single mask
+
 class WebSocketManager:
     def __init__(self):
-        self.active_connections: Dict[str, WebSocket] = {}
+        # connection_id -> WebSocket, sharded into small sub-dicts so
+        # connect/disconnect churn resizes one small table, not one big one
+        self._connection_shards: List[Dict[str, WebSocket]] = [{} for _ in range(_SHARD_COUNT)]
         self.session_connections: Dict[str, Set[str]] = {}
-        
+
+    def _shard(self, connection_id: str) -> Dict[str, WebSocket]:
+        return self._connection_shards[hash(connection_id) & (_SHARD_COUNT - 1)]
+
     async def connect(self, websocket: WebSocket, session_id: str, connection_id: str):
         await websocket.accept()
-        
-        self.active_connections[connection_id] = websocket
+
+        # Intern the ids: the same session_id/connection_id strings are repeated
+        # across every event dict and connection set, so sharing one string
+        # object per id keeps per-connection bookkeeping memory flat
+        session_id = sys.intern(session_id)
+        connection_id = sys.intern(connection_id)
+
+        self._shard(connection_id)[connection_id] = websocket
         
         if session_id not in self.session_connections:
             self.session_connections[session_id] = set()
@@ -31,9 +45,8 @@ class WebSocketManager:
         print(f"🔗 WebSocket connected: {connection_id} for session {session_id}")
     
     def disconnect(self, connection_id: str, session_id: str):
-        if connection_id in self.active_connections:
-            del self.active_connections[connection_id]
-        
+        self._shard(connection_id).pop(connection_id, None)
+
         if session_id in self.session_connections:
             self.session_connections[session_id].discard(connection_id)
             
@@ -56,9 +69,10 @@ class WebSocketManager:
         dead_connections = []
         
         for connection_id in self.session_connections[session_id]:
-            if connection_id in self.active_connections:
+            websocket = self._shard(connection_id).get(connection_id)
+            if websocket is not None:
                 try:
-                    await self.active_connections[connection_id].send_text(message)
+                    await websocket.send_text(message)
                 except Exception as e:
                     print(f"❌ Failed to send to {connection_id}: {e}")
                     dead_connections.append(connection_id)
@@ -222,23 +236,19 @@ class WebSocketManager:
     
     # Context adaptation
     async def show_context_adaptation(self, session_id: str, changes: List[Dict], confidence: float):
-        """Show context adaptation popup"""
+        """Show context adaptation popup (client manages its own dismiss timer)"""
         await self.send_to_session(session_id, {
             "type": "contextAdaptation",
             "changes": changes,
             "confidence": confidence,
             "adaptationType": "pattern_application",
+            "autoDismissMs": 2000,
+            "onComplete": {
+                "success": True,
+                "message": "✅ Pattern adapted successfully"
+            },
             "message": "🔄 Adapting cached pattern to new context..."
         })
-        
-        # Show for 2 seconds then auto-dismiss
-        await asyncio.sleep(2.0)
-        
-        await self.send_to_session(session_id, {
-            "type": "contextAdaptationComplete",
-            "success": True,
-            "message": "✅ Pattern adapted successfully"
-        })
     
     # Graph/Tree visualization events
     async def emit_graph_start(self, session_id: str, graph_state: Dict, is_learning: bool):
@@ -294,29 +304,52 @@ class WebSocketManager:
     
     # Batch events for complex flows
     async def emit_cached_execution_sequence(self, session_id: str, pattern_info: Dict, execution_steps: List[str]):
-        """Emit sequence of events for cached pattern execution"""
-        
-        # Start with pattern match
-        await self.emit_pattern_match_found(
-            session_id, 
-            pattern_info["pattern_id"], 
-            pattern_info["confidence"],
-            pattern_info.get("time_saving", {})
-        )
-        
-        await asyncio.sleep(0.5)
-        
-        # Show rapid tool execution
-        await self.broadcast_tool_sequence(session_id, execution_steps, "cached_pattern")
-        
-        # Show time savings
-        await self.emit_turn_reduction_achieved(
-            session_id,
-            pattern_info.get("original_turns", 5),
-            1,
-            pattern_info.get("time_saved", 4.0),
-            pattern_info["pattern_id"]
-        )
+        """Emit cached pattern execution as one event with embedded playback timing"""
+
+        # Build the per-tool steps with the delays the client should animate,
+        # instead of sleeping server-side between separate events
+        steps = []
+        for i, tool_name in enumerate(execution_steps):
+            tool_delay = {
+                "search": 0.8,
+                "getLocation": 0.5,
+                "checkCalendar": 1.2,
+                "lookupContact": 0.7,
+                "checkAvailability": 1.5,
+                "filterRestaurants": 0.9
+            }.get(tool_name, 0.8)
+
+            steps.append({
+                "toolName": tool_name,
+                "step": i + 1,
+                "total": len(execution_steps),
+                "result": self._generate_tool_result(tool_name, "cached_pattern"),
+                "delayMs": int(tool_delay * 1000)
+            })
+
+        original_turns = pattern_info.get("original_turns", 5)
+
+        # Single message: client plays back pattern match, tool steps, and
+        # the turn-reduction summary using the embedded delays
+        await self.send_to_session(session_id, {
+            "type": "cachedPatternExecution",
+            "patternMatch": {
+                "patternId": pattern_info["pattern_id"],
+                "confidence": pattern_info["confidence"],
+                "timeEstimate": pattern_info.get("time_saving", {}),
+                "message": f"🚀 Found cached pattern (confidence: {pattern_info['confidence']:.0%})"
+            },
+            "steps": steps,
+            "reduction": {
+                "originalTurns": original_turns,
+                "newTurns": 1,
+                "turnsReduced": original_turns - 1,
+                "timeSavedMinutes": pattern_info.get("time_saved", 4.0),
+                "efficiency": f"{((original_turns - 1) / original_turns * 100):.0f}% faster",
+                "patternId": pattern_info["pattern_id"],
+                "message": f"⚡ Completed in 1 turn(s) instead of {original_turns}!"
+            }
+        })
     
     async def emit_learning_sequence(self, session_id: str, task_type: str, learning_steps: List[Dict]):
         """Emit sequence of events for learning mode"""
@@ -347,7 +380,7 @@ class WebSocketManager:
     def get_connection_stats(self) -> Dict:
         """Get WebSocket connection statistics"""
         return {
-            "total_connections": len(self.active_connections),
+            "total_connections": sum(len(shard) for shard in self._connection_shards),
             "active_sessions": len(self.session_connections),
             "connections_per_session": {
                 session_id: len(connections) 
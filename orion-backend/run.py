@@ -62,15 +62,28 @@ def main():
         print(f"✅ All GEPA files found - Full functionality available")
     
     print("\n🚀 Starting server...")
-    
+
+    # Auto-reload only in dev: it forces single-worker mode and adds
+    # filesystem polling to the event loop. Anywhere else run one worker per
+    # core with the C event loop and HTTP parser.
+    dev_mode = os.getenv("ORION_ENV", "dev") == "dev"
+
     # Run the FastAPI server
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=dev_mode,
+        workers=1 if dev_mode else (os.cpu_count() or 2),
+        loop="auto" if dev_mode else "uvloop",
+        http="auto" if dev_mode else "httptools",
         log_level="info",
-        access_log=True
+        access_log=True,
+        # Learning/graph events are highly repetitive JSON; permessage-deflate
+        # with a shared sliding window compresses them ~5-10x on the wire
+        ws="websockets",
+        ws_per_message_deflate=True,
+        ws_max_size=2**20
     )
 
 if __name__ == "__main__":
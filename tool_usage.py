@@ -1,861 +1,380 @@
-tools = [
-    {
-        "type": "function",
-        "function": {
-            "name": "search_code_issues",
-            "description": "Search through code issues and bug reports by keywords, status, or assignee",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search term to look for in issue titles and discussions"
-                    },
-                    "status": {
-                        "type": "string",
-                        "enum": ["in_progress", "resolved", "planned", "blocked"],
-                        "description": "Filter by issue status"
-                    },
-                    "assignee": {
-                        "type": "string",
-                        "description": "Filter by person assigned to the issue"
-                    }
-                },
-                "required": ["query"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function", 
-        "function": {
-            "name": "get_issue_by_id",
-            "description": "Get detailed information about a specific issue by its ID",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "issue_id": {
-                        "type": "string",
-                        "description": "The unique ID of the issue (e.g., context_001)"
-                    }
-                },
-                "required": ["issue_id"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_issues_by_location",
-            "description": "Find all issues related to a specific file or code location",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "File path or partial path to search for (e.g., jwt_handler.py or /src/auth/)"
-                    }
-                },
-                "required": ["file_path"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "search_emails",
-            "description": "Search through emails by subject, body content, sender, or read status",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search term to look for in email subjects and body content"
-                    },
-                    "sender": {
-                        "type": "string",
-                        "description": "Filter by email sender (partial match)"
-                    },
-                    "read_status": {
-                        "type": "boolean",
-                        "description": "Filter by read status (true for read, false for unread)"
-                    }
-                },
-                "required": ["query"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_email_by_id",
-            "description": "Get detailed information about a specific email by its ID",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "email_id": {
-                        "type": "string",
-                        "description": "The unique ID of the email (e.g., email_001)"
-                    }
-                },
-                "required": ["email_id"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_emails_by_sender",
-            "description": "Get all emails from a specific sender",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "sender": {
-                        "type": "string",
-                        "description": "Email address or name of the sender"
-                    }
-                },
-                "required": ["sender"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "search_repo_files",
-            "description": "Search repository files by path, language, or contributor",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search term to look for in file paths"
-                    },
-                    "language": {
-                        "type": "string",
-                        "enum": ["python", "typescript", "yaml", "markdown", "json", "shell", "sql"],
-                        "description": "Filter by programming language"
-                    },
-                    "contributor": {
-                        "type": "string",
-                        "description": "Filter by contributor name"
-                    }
-                },
-                "required": ["query"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_file_by_path",
-            "description": "Get detailed information about a specific file by its path",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "File path to search for (e.g., jwt_handler.py or /src/auth/)"
-                    }
-                },
-                "required": ["file_path"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "search_dependencies",
-            "description": "Find dependency information by package name",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "package_name": {
-                        "type": "string",
-                        "description": "Name of the package/dependency to search for"
-                    }
-                },
-                "required": ["package_name"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "search_local_files",
-            "description": "Search local filesystem files by path, extension, or directory",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search term to look for in file paths"
-                    },
-                    "extension": {
-                        "type": "string",
-                        "enum": [".pdf", ".md", ".py", ".yml", ".txt", ".png", ".tar.gz", ".xlsx", ".json", ".env", ".html"],
-                        "description": "Filter by file extension"
-                    },
-                    "directory": {
-                        "type": "string",
-                        "description": "Filter by directory path (e.g., Downloads, Documents, Code)"
-                    }
-                },
-                "required": ["query"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_local_file_by_path",
-            "description": "Get detailed information about a specific local file by its path",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Local file path to search for"
-                    }
-                },
-                "required": ["file_path"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_directory_info",
-            "description": "Get information about a specific directory including file count and size",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "dir_path": {
-                        "type": "string",
-                        "description": "Directory path to get information for"
-                    }
-                },
-                "required": ["dir_path"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "search_restaurants",
-            "description": "Search restaurants by cuisine, area, or dietary restrictions",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "cuisine": {
-                        "type": "string",
-                        "enum": ["american", "italian", "indian", "coffee", "mexican", "french", "seafood", "chinese", "burmese", "fusion", "greek"],
-                        "description": "Filter by cuisine type"
-                    },
-                    "area": {
-                        "type": "string",
-                        "enum": ["downtown", "berkeley", "mission", "north_beach", "marina", "castro", "sunset", "haight", "palo_alto", "chinatown"],
-                        "description": "Filter by area/neighborhood"
-                    },
-                    "dietary": {
-                        "type": "string",
-                        "enum": ["vegetarian", "vegan_options", "gluten_free", "halal", "organic"],
-                        "description": "Filter by dietary options"
-                    }
-                },
-                "required": [],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_restaurant_by_id",
-            "description": "Get detailed information about a specific restaurant by its ID",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "restaurant_id": {
-                        "type": "string",
-                        "description": "The unique ID of the restaurant (e.g., rest_001)"
-                    }
-                },
-                "required": ["restaurant_id"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "find_restaurants_by_distance",
-            "description": "Find restaurants within a specific distance, sorted by proximity",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "max_distance_km": {
-                        "type": "number",
-                        "description": "Maximum distance in kilometers"
-                    }
-                },
-                "required": ["max_distance_km"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "search_system_logs",
-            "description": "Search system logs by service, log level, or error code",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "service": {
-                        "type": "string",
-                        "enum": ["auth-service", "monitoring-service", "database", "api-gateway", "load-balancer", "redis-cache", "payment-service", "user-service"],
-                        "description": "Filter by service name"
-                    },
-                    "level": {
-                        "type": "string",
-                        "enum": ["ERROR", "CRITICAL", "INFO", "WARN", "DEBUG"],
-                        "description": "Filter by log level"
-                    },
-                    "error_code": {
-                        "type": "string",
-                        "description": "Filter by specific error code"
-                    }
-                },
-                "required": [],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_metrics_by_service",
-            "description": "Get performance metrics for a specific service",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "service": {
-                        "type": "string",
-                        "description": "Service name to get metrics for"
-                    }
-                },
-                "required": ["service"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_logs_by_timeframe",
-            "description": "Get logs within a specific time range",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "start_time": {
-                        "type": "string",
-                        "description": "Start timestamp in ISO format (e.g., 2024-01-15T09:00:00Z)"
-                    },
-                    "end_time": {
-                        "type": "string",
-                        "description": "End timestamp in ISO format (e.g., 2024-01-15T18:00:00Z)"
-                    }
-                },
-                "required": ["start_time", "end_time"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "search_transactions",
-            "description": "Search financial transactions by category, employee, or card type",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "category": {
-                        "type": "string",
-                        "enum": ["alerts", "transportation", "infrastructure", "meals", "office", "consulting", "software"],
-                        "description": "Filter by transaction category"
-                    },
-                    "employee": {
-                        "type": "string",
-                        "description": "Filter by employee name"
-                    },
-                    "card_type": {
-                        "type": "string",
-                        "enum": ["corporate", "personal"],
-                        "description": "Filter by card type"
-                    }
-                },
-                "required": [],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_transaction_by_id",
-            "description": "Get detailed information about a specific transaction by its ID",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "transaction_id": {
-                        "type": "string",
-                        "description": "The unique ID of the transaction (e.g., TXN-20240115-0001)"
-                    }
-                },
-                "required": ["transaction_id"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_expenses_by_timeframe",
-            "description": "Get all expenses within a specific time range",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "start_time": {
-                        "type": "string",
-                        "description": "Start timestamp in ISO format (e.g., 2024-01-15T09:00:00Z)"
-                    },
-                    "end_time": {
-                        "type": "string",
-                        "description": "End timestamp in ISO format (e.g., 2024-01-15T18:00:00Z)"
-                    }
-                },
-                "required": ["start_time", "end_time"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "search_calendar_events",
-            "description": "Search calendar events by title, location, or attendee",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search term to look for in event titles and descriptions"
-                    },
-                    "attendee": {
-                        "type": "string",
-                        "description": "Filter by attendee email or name"
-                    },
-                    "location": {
-                        "type": "string",
-                        "description": "Filter by location (partial match)"
-                    }
-                },
-                "required": ["query"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_calendar_by_date",
-            "description": "Get all calendar events for a specific date",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "date": {
-                        "type": "string",
-                        "description": "Date in ISO format (e.g., 2024-01-15)"
-                    }
-                },
-                "required": ["date"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "check_time_availability",
-            "description": "Check if a specific time slot is free",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "start_time": {
-                        "type": "string",
-                        "description": "Start time in ISO format (e.g., 2024-01-15T14:00:00Z)"
-                    },
-                    "end_time": {
-                        "type": "string",
-                        "description": "End time in ISO format (e.g., 2024-01-15T15:00:00Z)"
-                    }
-                },
-                "required": ["start_time", "end_time"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_calendar_event_by_id",
-            "description": "Get detailed information about a specific calendar event by its ID",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "event_id": {
-                        "type": "string",
-                        "description": "The unique ID of the calendar event (e.g., cal_event_001)"
-                    }
-                },
-                "required": ["event_id"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_events_by_timeframe",
-            "description": "Get all calendar events within a specific time range",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "start_time": {
-                        "type": "string",
-                        "description": "Start timestamp in ISO format (e.g., 2024-01-15T09:00:00Z)"
-                    },
-                    "end_time": {
-                        "type": "string",
-                        "description": "End timestamp in ISO format (e.g., 2024-01-15T18:00:00Z)"
-                    }
-                },
-                "required": ["start_time", "end_time"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "create_calendar_event",
-            "description": "Create a new calendar event and add it to the calendar",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": "Event title"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Event description"
-                    },
-                    "start_time": {
-                        "type": "string",
-                        "description": "Start time in ISO format (e.g., 2024-01-15T14:00:00Z)"
-                    },
-                    "end_time": {
-                        "type": "string",
-                        "description": "End time in ISO format (e.g., 2024-01-15T15:00:00Z)"
-                    },
-                    "location": {
-                        "type": "string",
-                        "description": "Event location (optional)"
-                    },
-                    "attendees": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "email": {"type": "string"},
-                                "name": {"type": "string"}
-                            }
-                        },
-                        "description": "List of attendees"
-                    }
-                },
-                "required": ["title", "start_time", "end_time"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "find_free_time_slots",
-            "description": "Find available time slots within a date range",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "start_date": {
-                        "type": "string",
-                        "description": "Start date in ISO format (e.g., 2024-01-15)"
-                    },
-                    "end_date": {
-                        "type": "string",
-                        "description": "End date in ISO format (e.g., 2024-01-20)"
-                    },
-                    "duration_minutes": {
-                        "type": "integer",
-                        "description": "Required duration in minutes (e.g., 60)"
-                    },
-                    "working_hours_only": {
-                        "type": "boolean",
-                        "description": "Only show slots during working hours (9 AM - 6 PM)"
-                    }
-                },
-                "required": ["start_date", "end_date", "duration_minutes"],
-                "additionalProperties": False
-            },
-            "strict": False
-        }
-    }
-]
-
-from tools import search_code_issues, get_issue_by_id, get_issues_by_location, search_emails, get_email_by_id, get_emails_by_sender, search_repo_files, get_file_by_path, search_dependencies, search_local_files, get_local_file_by_path, get_directory_info, search_restaurants, get_restaurant_by_id, find_restaurants_by_distance, search_system_logs, get_metrics_by_service, get_logs_by_timeframe, search_transactions, get_transaction_by_id, get_expenses_by_timeframe, search_calendar_events, get_calendar_by_date, check_time_availability, get_calendar_event_by_id, get_events_by_timeframe, create_calendar_event, find_free_time_slots, load_calendar, save_calendar
+import functools
 import json
+import pickle
+import sys
+import time
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps_compact(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+def _intern_tree(obj):
+    """Intern every string in a parsed JSON tree.
+
+    The schema repeats the same keys and values ('type', 'string',
+    'description', the ISO-format examples, ...) hundreds of times; interning
+    makes each duplicate share one string object, which also turns downstream
+    dict-key lookups and comparisons into pointer checks.
+    """
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, list):
+        return [_intern_tree(v) for v in obj]
+    if isinstance(obj, dict):
+        return {sys.intern(k): _intern_tree(v) for k, v in obj.items()}
+    return obj
+
+@functools.lru_cache(maxsize=1)
+def get_tools():
+    """Load the tool schema list once; every caller shares the same object.
+
+    A pickle cache next to the JSON source skips the parse + intern walk on
+    subsequent imports. Interning happens before the dump, so pickle's memo
+    stores each repeated string once and the loaded tree keeps the sharing.
+    The cache is best-effort: stale, missing, or unwritable falls back to JSON.
+    """
+    source = Path(__file__).with_name("tools_schema.json")
+    cached = source.with_suffix(".pkl")
+    try:
+        if cached.stat().st_mtime_ns > source.stat().st_mtime_ns:
+            return pickle.loads(cached.read_bytes())
+    except Exception:
+        # Truncated or otherwise corrupt cache (EOFError, bad opcodes, ...):
+        # fall through to the JSON parse, which rewrites it
+        pass
+    raw = source.read_bytes()
+    tools = _intern_tree(orjson.loads(raw) if orjson is not None else json.loads(raw))
+    try:
+        cached.write_bytes(pickle.dumps(tools, protocol=5))
+    except OSError:
+        pass
+    return tools
+
+@functools.lru_cache(maxsize=1)
+def get_tools_json() -> bytes:
+    """Canonical wire form of the schema, encoded once.
+
+    Anything that ships the tools list on every request (LLM calls, HTTP
+    responses) should send these bytes instead of re-walking the dict tree
+    through a JSON encoder per call.
+    """
+    return _dumps_compact(get_tools())
+
+def build_request_bytes(messages, model: str = "gpt-4o") -> bytes:
+    """Assemble a chat-completions request body for raw HTTP clients.
+
+    The tools block dominates the payload and never changes, so it is spliced
+    in as the cached get_tools_json() bytes; only the messages are encoded per
+    call. The OpenAI SDK encodes its own payload and cannot take
+    pre-serialized fragments -- use this with httpx/aiohttp against the API
+    directly.
+    """
+    return (b'{"model":' + _dumps_compact(model)
+            + b',"tools":' + get_tools_json()
+            + b',"parallel_tool_calls":true'
+            + b',"messages":' + _dumps_compact(messages)
+            + b'}')
+
+from tools import search_code_issues, get_issue_by_id, get_issues_by_location, search_emails, get_email_by_id, get_emails_by_sender, search_repo_files, get_file_by_path, search_dependencies, search_local_files, get_local_file_by_path, get_directory_info, search_restaurants, get_restaurant_by_id, find_restaurants_by_distance, search_system_logs, get_metrics_by_service, get_logs_by_timeframe, search_transactions, get_transaction_by_id, get_expenses_by_timeframe, search_calendar_events, get_calendar_by_date, check_time_availability, get_calendar_event_by_id, get_events_by_timeframe, create_calendar_event, create_calendar_events, find_free_time_slots, load_calendar, save_calendar, get_issues_by_ids, get_emails_by_ids, get_transactions_by_ids, multi_pattern_search, load_code_contexts, load_emails
+
+# Enum-constrained parameters from the schema, precompiled into frozensets of
+# interned strings. LLM tool calls regularly carry hallucinated filter values;
+# those are rejected with an O(1) membership check before any dataset scan.
+# Built on first use so importing this module does not touch the schema.
+@functools.lru_cache(maxsize=1)
+def _enum_sets():
+    # Lowercase-normalized: the tools compare enum-constrained filters
+    # case-insensitively, so the guards must accept the same case variants
+    sets = {}
+    for tool in get_tools():
+        fn_schema = tool["function"]
+        for pname, prop in fn_schema["parameters"]["properties"].items():
+            if "enum" in prop:
+                sets[(fn_schema["name"], pname)] = frozenset(sys.intern(v.lower()) for v in prop["enum"])
+    return sets
+
+def _enum_guard(fn_name, fn, param_names):
+    enum_params = None
+    def guarded(*args, **kwargs):
+        nonlocal enum_params
+        if enum_params is None:
+            sets = _enum_sets()
+            enum_params = [(i, p, sets[(fn_name, p)]) for i, p in enumerate(param_names) if (fn_name, p) in sets]
+        for i, pname, allowed in enum_params:
+            value = kwargs.get(pname, args[i] if i < len(args) else None)
+            if value is not None and value.lower() not in allowed:
+                return []
+        return fn(*args, **kwargs)
+    return guarded
+
+# Agents tend to re-issue the exact same tool call within a conversation, so
+# wrap every read-only tool in an LRU cache; a hit is a dict lookup instead of
+# a dataset scan. Calendar writes clear all read caches since any cached
+# calendar result may be stale afterwards.
+_cached_tools = []
+
+def _cache(fn):
+    cached = functools.lru_cache(maxsize=256)(fn)
+    _cached_tools.append(cached)
+    return cached
+
+search_code_issues = _enum_guard("search_code_issues", _cache(search_code_issues), ("query", "status", "assignee"))
+get_issue_by_id = _cache(get_issue_by_id)
+get_issues_by_location = _cache(get_issues_by_location)
+search_emails = _cache(search_emails)
+get_email_by_id = _cache(get_email_by_id)
+get_emails_by_sender = _cache(get_emails_by_sender)
+search_repo_files = _enum_guard("search_repo_files", _cache(search_repo_files), ("query", "language", "contributor"))
+get_file_by_path = _cache(get_file_by_path)
+search_dependencies = _cache(search_dependencies)
+search_local_files = _enum_guard("search_local_files", _cache(search_local_files), ("query", "extension", "directory"))
+get_local_file_by_path = _cache(get_local_file_by_path)
+get_directory_info = _cache(get_directory_info)
+search_restaurants = _enum_guard("search_restaurants", _cache(search_restaurants), ("cuisine", "area", "dietary"))
+get_restaurant_by_id = _cache(get_restaurant_by_id)
+find_restaurants_by_distance = _cache(find_restaurants_by_distance)
+search_system_logs = _enum_guard("search_system_logs", _cache(search_system_logs), ("service", "level", "error_code"))
+get_metrics_by_service = _cache(get_metrics_by_service)
+get_logs_by_timeframe = _cache(get_logs_by_timeframe)
+search_transactions = _enum_guard("search_transactions", _cache(search_transactions), ("category", "employee", "card_type"))
+get_transaction_by_id = _cache(get_transaction_by_id)
+get_expenses_by_timeframe = _cache(get_expenses_by_timeframe)
+search_calendar_events = _cache(search_calendar_events)
+get_calendar_by_date = _cache(get_calendar_by_date)
+check_time_availability = _cache(check_time_availability)
+get_calendar_event_by_id = _cache(get_calendar_event_by_id)
+get_events_by_timeframe = _cache(get_events_by_timeframe)
+find_free_time_slots = _cache(find_free_time_slots)
+
+def _invalidate_tool_caches():
+    for cached in _cached_tools:
+        cached.cache_clear()
+
+# create_calendar_event takes an unhashable attendees list, so it is not
+# cached itself -- it just invalidates the read caches after writing
+_create_calendar_event = create_calendar_event
+def create_calendar_event(*args, **kwargs):
+    result = _create_calendar_event(*args, **kwargs)
+    _invalidate_tool_caches()
+    return result
+
+_create_calendar_events = create_calendar_events
+def create_calendar_events(events_to_create):
+    result = _create_calendar_events(events_to_create)
+    _invalidate_tool_caches()
+    return result
+
+_save_calendar = save_calendar
+def save_calendar(events, pretty=True):
+    _save_calendar(events, pretty)
+    _invalidate_tool_caches()
+
+# Per-tool wall-time attribution: every call appends (tool, elapsed ns) to a
+# log (list.append is atomic, so the threaded harness needs no lock) and
+# tool_timings() aggregates it. This sits outside the lru_cache layer, so warm
+# hits show up as near-zero entries against the cold first call.
+_phase_log = []
+
+def _timed(name, fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        t0 = time.perf_counter_ns()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _phase_log.append((name, time.perf_counter_ns() - t0))
+    return wrapper
+
+def tool_timings():
+    """Aggregate the call log into (tool, total_ns, calls), slowest first."""
+    totals = {}
+    counts = {}
+    for name, elapsed in _phase_log:
+        totals[name] = totals.get(name, 0) + elapsed
+        counts[name] = counts.get(name, 0) + 1
+    return sorted(((name, totals[name], counts[name]) for name in totals),
+                  key=lambda row: -row[1])
+
+for _name in ("search_code_issues", "get_issue_by_id", "get_issues_by_location",
+              "search_emails", "get_email_by_id", "get_emails_by_sender",
+              "search_repo_files", "get_file_by_path", "search_dependencies",
+              "search_local_files", "get_local_file_by_path", "get_directory_info",
+              "search_restaurants", "get_restaurant_by_id", "find_restaurants_by_distance",
+              "search_system_logs", "get_metrics_by_service", "get_logs_by_timeframe",
+              "search_transactions", "get_transaction_by_id", "get_expenses_by_timeframe",
+              "search_calendar_events", "get_calendar_by_date", "check_time_availability",
+              "get_issues_by_ids", "get_emails_by_ids", "get_transactions_by_ids",
+              "get_calendar_event_by_id", "get_events_by_timeframe", "create_calendar_event",
+              "create_calendar_events",
+              "find_free_time_slots", "multi_pattern_search", "save_calendar"):
+    globals()[_name] = _timed(_name, globals()[_name])
+del _name
+
+# Tool-call router: resolving a tool by schema name is one dict probe into
+# the registry instead of a getattr walk per call, and the resolved callable
+# already carries the enum-guard, cache, and timing layers. Built lazily from
+# the final bindings; `tools` and `TOOL_REGISTRY` resolve through the PEP 562
+# module __getattr__ below, so `import tool_usage` never reads the schema.
+@functools.lru_cache(maxsize=1)
+def _registry():
+    return {tool["function"]["name"]: globals()[tool["function"]["name"]] for tool in get_tools()}
+
+def validate_tool_args(name, arguments):
+    """Check enum-constrained arguments against the precompiled frozensets.
+
+    Raises ValueError naming the offending parameter and the allowed values.
+    The in-tool guard silently returns no results for bad filter values so an
+    agent loop keeps running; a dispatcher that would rather surface the
+    mistake to the model (so it can correct the call) uses this instead.
+    """
+    sets = _enum_sets()
+    for pname, value in arguments.items():
+        allowed = sets.get((name, pname))
+        if allowed is not None and value is not None and value.lower() not in allowed:
+            raise ValueError(
+                f"{name}: invalid value {value!r} for {pname!r}; expected one of {sorted(allowed)}")
+
+def dispatch(name, **kwargs):
+    """Invoke a tool by its schema name; raises KeyError for unknown names."""
+    return _registry()[name](**kwargs)
+
+def __getattr__(name):
+    if name == "tools":
+        return get_tools()
+    if name == "TOOL_REGISTRY":
+        return _registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
-    print("Testing search_code_issues:")
-    result = search_code_issues("JWT", "resolved")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting get_issue_by_id:")
-    result = get_issue_by_id("context_001")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting get_issues_by_location:")
-    result = get_issues_by_location("jwt_handler.py")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting search_emails:")
-    result = search_emails("JWT", None, False)
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting get_email_by_id:")
-    result = get_email_by_id("email_001")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting get_emails_by_sender:")
-    result = get_emails_by_sender("sarah.johnson")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting search_repo_files:")
-    result = search_repo_files("auth", "python")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting get_file_by_path:")
-    result = get_file_by_path("jwt_handler.py")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting search_dependencies:")
-    result = search_dependencies("pyjwt")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting search_local_files:")
-    result = search_local_files("auth", ".pdf")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting get_local_file_by_path:")
-    result = get_local_file_by_path("debug_session")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting get_directory_info:")
-    result = get_directory_info("Downloads")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting search_restaurants:")
-    result = search_restaurants("indian", None, "vegetarian")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting get_restaurant_by_id:")
-    result = get_restaurant_by_id("rest_003")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting find_restaurants_by_distance:")
-    result = find_restaurants_by_distance(2.0)
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting search_system_logs:")
-    result = search_system_logs("auth-service", "ERROR")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting get_metrics_by_service:")
-    result = get_metrics_by_service("auth-service")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting get_logs_by_timeframe:")
-    result = get_logs_by_timeframe("2024-01-15T09:00:00Z", "2024-01-15T16:00:00Z")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting search_transactions:")
-    result = search_transactions("infrastructure", None, "corporate")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting get_transaction_by_id:")
-    result = get_transaction_by_id("TXN-20240115-0001")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting get_expenses_by_timeframe:")
-    result = get_expenses_by_timeframe("2024-01-15T09:00:00Z", "2024-01-15T18:00:00Z")
-    print(json.dumps(result, indent=2))
-
-
-    print("Testing search_calendar_events:")
-    result = search_calendar_events("auth", None, None)
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting search_calendar_events with attendee filter:")
-    result = search_calendar_events("meeting", "sarah.johnson")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting search_calendar_events with location filter:")
-    result = search_calendar_events("", None, "Conference Room")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting get_calendar_by_date:")
-    result = get_calendar_by_date("2024-01-15")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting get_calendar_by_date (busy day):")
-    result = get_calendar_by_date("2024-01-17")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting check_time_availability (should be free):")
-    result = check_time_availability("2024-01-15T08:00:00Z", "2024-01-15T08:30:00Z")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting check_time_availability (should have conflicts):")
-    result = check_time_availability("2024-01-15T09:00:00Z", "2024-01-15T10:00:00Z")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting get_calendar_event_by_id:")
-    result = get_calendar_event_by_id("cal_event_001")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting get_calendar_event_by_id (non-existent):")
-    result = get_calendar_event_by_id("cal_event_999")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting get_events_by_timeframe:")
-    result = get_events_by_timeframe("2024-01-15T09:00:00Z", "2024-01-15T18:00:00Z")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting get_events_by_timeframe (wider range):")
-    result = get_events_by_timeframe("2024-01-17T00:00:00Z", "2024-01-18T23:59:59Z")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting create_calendar_event (simple):")
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    results = {}
+
+    # Batch prescan: scan each corpus once for the full set of query terms the
+    # harness uses below, instead of once per search call
+    harness_queries = ["JWT", "auth", "meeting", "infrastructure"]
+    results["batch_prescan"] = {
+        dataset: {p: len(ids) for p, ids in hits.items()}
+        for dataset, hits in {
+            "code_contexts": multi_pattern_search(harness_queries, load_code_contexts(), ["issue_title", "discussion"]),
+            "emails": multi_pattern_search(harness_queries, load_emails(), ["subject", "body"]),
+            "calendar": multi_pattern_search(harness_queries, load_calendar(), ["title", "description"]),
+        }.items()
+    }
+
+    # Read-only tool calls: independent of each other and of the calendar
+    # mutations further down
+    read_only_cases = [
+        ("search_code_issues", search_code_issues, ("JWT", "resolved"), {}),
+        ("get_issue_by_id", get_issue_by_id, ("context_001",), {}),
+        ("get_issues_by_location", get_issues_by_location, ("jwt_handler.py",), {}),
+        ("search_emails", search_emails, ("JWT", None, False), {}),
+        ("get_email_by_id", get_email_by_id, ("email_001",), {}),
+        ("get_emails_by_sender", get_emails_by_sender, ("sarah.johnson",), {}),
+        ("search_repo_files", search_repo_files, ("auth", "python"), {}),
+        ("get_file_by_path", get_file_by_path, ("jwt_handler.py",), {}),
+        ("search_dependencies", search_dependencies, ("pyjwt",), {}),
+        ("search_local_files", search_local_files, ("auth", ".pdf"), {}),
+        ("get_local_file_by_path", get_local_file_by_path, ("debug_session",), {}),
+        ("get_directory_info", get_directory_info, ("Downloads",), {}),
+        ("search_restaurants", search_restaurants, ("indian", None, "vegetarian"), {}),
+        ("get_restaurant_by_id", get_restaurant_by_id, ("rest_003",), {}),
+        ("find_restaurants_by_distance", find_restaurants_by_distance, (2.0,), {}),
+        ("search_system_logs", search_system_logs, ("auth-service", "ERROR"), {}),
+        ("get_metrics_by_service", get_metrics_by_service, ("auth-service",), {}),
+        ("get_logs_by_timeframe", get_logs_by_timeframe, ("2024-01-15T09:00:00Z", "2024-01-15T16:00:00Z"), {}),
+        ("search_transactions", search_transactions, ("infrastructure", None, "corporate"), {}),
+        ("get_transaction_by_id", get_transaction_by_id, ("TXN-20240115-0001",), {}),
+        ("get_expenses_by_timeframe", get_expenses_by_timeframe, ("2024-01-15T09:00:00Z", "2024-01-15T18:00:00Z"), {}),
+        ("search_calendar_events", search_calendar_events, ("auth", None, None), {}),
+        ("search_calendar_events (attendee filter)", search_calendar_events, ("meeting", "sarah.johnson"), {}),
+        ("search_calendar_events (location filter)", search_calendar_events, ("", None, "Conference Room"), {}),
+        ("get_calendar_by_date", get_calendar_by_date, ("2024-01-15",), {}),
+        ("get_calendar_by_date (busy day)", get_calendar_by_date, ("2024-01-17",), {}),
+        ("check_time_availability (should be free)", check_time_availability, ("2024-01-15T08:00:00Z", "2024-01-15T08:30:00Z"), {}),
+        ("check_time_availability (should have conflicts)", check_time_availability, ("2024-01-15T09:00:00Z", "2024-01-15T10:00:00Z"), {}),
+        ("get_calendar_event_by_id", get_calendar_event_by_id, ("cal_event_001",), {}),
+        ("get_calendar_event_by_id (non-existent)", get_calendar_event_by_id, ("cal_event_999",), {}),
+        ("get_events_by_timeframe", get_events_by_timeframe, ("2024-01-15T09:00:00Z", "2024-01-15T18:00:00Z"), {}),
+        ("get_events_by_timeframe (wider range)", get_events_by_timeframe, ("2024-01-17T00:00:00Z", "2024-01-18T23:59:59Z"), {}),
+    ]
+
+    # The cases are mutually independent and mostly blocked on file reads, so
+    # run them on a thread pool. Results are drained as they complete -- a
+    # slow case never blocks collection of the others -- then written into
+    # results in table order so the output stays deterministic.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {executor.submit(fn, *args, **kwargs): label for label, fn, args, kwargs in read_only_cases}
+        completed = {futures[future]: future.result() for future in as_completed(futures)}
+    for label, _, _, _ in read_only_cases:
+        results[label] = completed[label]
+
+    # Calendar mutation tests run serially: later reads depend on the writes
     result = create_calendar_event(
-        title="Test Meeting",
-        start_time="2024-01-22T14:00:00Z",
-        end_time="2024-01-22T15:00:00Z",
-        description="Unit test meeting"
+        "Test Meeting",
+        "2024-01-22T14:00:00Z",
+        "2024-01-22T15:00:00Z",
+        "Unit test meeting"
     )
     test_event_id_1 = result['id']
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting create_calendar_event (with location and attendees):")
+    results["create_calendar_event (simple)"] = result
+
     result = create_calendar_event(
-        title="Team Sync",
-        start_time="2024-01-22T16:00:00Z", 
-        end_time="2024-01-22T17:00:00Z",
-        description="Weekly team synchronization",
-        location="Conference Room B",
-        attendees=[
+        "Team Sync",
+        "2024-01-22T16:00:00Z",
+        "2024-01-22T17:00:00Z",
+        "Weekly team synchronization",
+        "Conference Room B",
+        [
             {"email": "aman.priyanshu@company.com", "name": "Aman Priyanshu", "response": "accepted", "organizer": True},
             {"email": "sarah.johnson@company.com", "name": "Sarah Johnson", "response": "accepted", "organizer": False}
         ]
     )
     test_event_id_2 = result['id']
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting find_free_time_slots (working hours only):")
-    result = find_free_time_slots("2024-01-15", "2024-01-16", 60, working_hours_only=True)
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting find_free_time_slots (30 min slots, any time):")
-    result = find_free_time_slots("2024-01-19", "2024-01-19", 30, working_hours_only=False)
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting find_free_time_slots (2 hour slots):")
-    result = find_free_time_slots("2024-01-20", "2024-01-21", 120, working_hours_only=True)
-    print(json.dumps(result, indent=2))
-    
-    # Test edge cases
-    print("\nTesting search_calendar_events (empty query):")
-    result = search_calendar_events("", None, None)
-    print(f"Found {len(result)} events with empty query")
-    
-    print("\nTesting search_calendar_events (no matches):")
-    result = search_calendar_events("nonexistent event xyz")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting get_calendar_by_date (weekend/no events):")
-    result = get_calendar_by_date("2024-01-13")  # Assuming this is a quiet day
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting check_time_availability (exact match with existing event):")
-    result = check_time_availability("2024-01-15T09:30:00Z", "2024-01-15T10:30:00Z")
-    print(json.dumps(result, indent=2))
-    
-    print("\nTesting get_events_by_timeframe (very narrow window):")
-    result = get_events_by_timeframe("2024-01-15T09:30:00Z", "2024-01-15T09:31:00Z")
-    print(json.dumps(result, indent=2))
-    
+    results["create_calendar_event (with location and attendees)"] = result
+
+    results["find_free_time_slots (working hours only)"] = find_free_time_slots("2024-01-15", "2024-01-16", 60, True)
+    results["find_free_time_slots (30 min slots, any time)"] = find_free_time_slots("2024-01-19", "2024-01-19", 30, False)
+    results["find_free_time_slots (2 hour slots)"] = find_free_time_slots("2024-01-20", "2024-01-21", 120, True)
+
+    # Edge cases
+    results["search_calendar_events (empty query)"] = f"Found {len(search_calendar_events('', None, None))} events with empty query"
+    results["search_calendar_events (no matches)"] = search_calendar_events("nonexistent event xyz", None, None)
+    results["get_calendar_by_date (weekend/no events)"] = get_calendar_by_date("2024-01-13")  # Assuming this is a quiet day
+    results["check_time_availability (exact match with existing event)"] = check_time_availability("2024-01-15T09:30:00Z", "2024-01-15T10:30:00Z")
+    results["get_events_by_timeframe (very narrow window)"] = get_events_by_timeframe("2024-01-15T09:30:00Z", "2024-01-15T09:31:00Z")
+
     # Clean up test events
-    print("\nCleaning up test events...")
     events = load_calendar()
-    events = [e for e in events if e['id'] not in [test_event_id_1, test_event_id_2]]
+    test_event_ids = frozenset((test_event_id_1, test_event_id_2))
+    events = [e for e in events if e['id'] not in test_event_ids]
     save_calendar(events)
-    print(f"Deleted test events: {test_event_id_1}, {test_event_id_2}")
\ No newline at end of file
+    results["cleanup"] = f"Deleted test events: {test_event_id_1}, {test_event_id_2}"
+
+    # One encode + one write instead of 30+ indent=2 dumps and prints
+    # One buffer, one write: orjson encodes the whole results dict in C and
+    # sys.stdout.buffer skips the text-layer utf-8 re-encode. Output is raw
+    # UTF-8 instead of \u-escaped ASCII; parsed content is identical.
+    if orjson is not None:
+        encoded = orjson.dumps(results, option=orjson.OPT_INDENT_2)
+    else:
+        encoded = json.dumps(results, indent=2).encode()
+    sys.stdout.buffer.write(encoded)
+    sys.stdout.buffer.write(b"\n")
+
+    # Timing summary goes to stderr so stdout stays machine-readable JSON;
+    # assembled in memory and flushed with one write, like the report above
+    timings = tool_timings()
+    if timings:
+        width = max(len(name) for name, _, _ in timings)
+        table = [f"\n{'tool':<{width}}  {'calls':>5}  {'total ms':>9}\n"]
+        table.extend(f"{name:<{width}}  {calls:>5}  {total_ns / 1e6:>9.3f}\n"
+                     for name, total_ns, calls in timings)
+        sys.stderr.write("".join(table))
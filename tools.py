@@ -1,46 +1,253 @@
+import bisect
 import json
-from typing import List, Dict, Any, Optional
+import os
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# orjson decodes/encodes several times faster than stdlib json; fall back
+# silently when it is not installed, as in tool_usage.get_tools_json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Facet indexes: map an exact filter value (status, cuisine, level, ...) to the
+# records carrying it, so equality filters become one dict lookup instead of a
+# full scan. Built lazily on first use, one index per (dataset, field).
+_facet_indexes: Dict[str, Any] = {}
+_index_lock = threading.Lock()
+
+def _facet_index(name: str, loader: Callable[[], List[Dict[str, Any]]],
+                 keys_fn: Callable[[Dict[str, Any]], Iterable[Any]]) -> Dict[Any, List[Dict[str, Any]]]:
+    # Revalidated against the loader like the other caches: the loaders are
+    # mtime-cached, so the identity probe is cheap and a rewritten fixture
+    # (the calendar after a write) rebuilds the facet transparently
+    records = loader()
+    entry = _facet_indexes.get(name)
+    if entry is None or entry[0] is not records:
+        with _index_lock:
+            entry = _facet_indexes.get(name)
+            if entry is None or entry[0] is not records:
+                index = defaultdict(list)
+                for record in records:
+                    for key in keys_fn(record):
+                        index[key].append(record)
+                entry = (records, dict(index))
+                _facet_indexes[name] = entry
+    return entry[1]
+
+# Every tool call used to re-open and re-parse its fixture from disk. One
+# decoded-JSON cache covers all of them, keyed by path and invalidated by the
+# file's mtime: repeat loads are a dict probe, and a changed file (the
+# calendar after a write) is re-read transparently. The identity of the
+# decoded object is stable while the cache holds, which is what the
+# index-validation checks (`loader() is not ...`) key off.
+_json_cache: Dict[str, Any] = {}
+
+def _cached_json(path: str):
+    mtime = os.stat(path).st_mtime_ns
+    entry = _json_cache.get(path)
+    if entry is None or entry[0] != mtime:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        entry = (mtime, orjson.loads(raw) if orjson is not None else json.loads(raw))
+        _json_cache[path] = entry
+    return entry[1]
+
+_DATA_LAKE_FILES = (
+    'data_lake/calendar.json',
+    'data_lake/code_contexts.json',
+    'data_lake/emails.json',
+    'data_lake/github_repo_alignment.json',
+    'data_lake/local_filesystem.json',
+    'data_lake/restaurant.json',
+    'data_lake/system_logs.json',
+    'data_lake/transactions.json',
+)
+
+def preload_data_lake():
+    """Decode every fixture into the cache in one pass.
+
+    Loading stays lazy by default; a long-lived server calls this at startup
+    so no request pays the cold open+parse for whichever corpus it touches
+    first. Repeat runs in a warm OS page cache make the reads themselves
+    nearly free.
+    """
+    for path in _DATA_LAKE_FILES:
+        _cached_json(path)
 
 def load_calendar():
-    with open('data_lake/calendar.json', 'r') as f:
-        return json.load(f)['calendar_events']
-
-def save_calendar(events):
-    with open('data_lake/calendar.json', 'w') as f:
-        json.dump({"calendar_events": events}, f, indent=2)
+    return _cached_json('data_lake/calendar.json')['calendar_events']
+
+def save_calendar(events, pretty: bool = True):
+    """Write the calendar file; pass pretty=False to skip indentation when
+    nothing human-facing will read the output (compact serialization avoids
+    the per-line string writes of indent=2)."""
+    payload = {"calendar_events": events}
+    with open('data_lake/calendar.json', 'wb') as f:
+        if orjson is not None:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else 0))
+        elif pretty:
+            f.write(json.dumps(payload, indent=2).encode())
+        else:
+            f.write(json.dumps(payload, separators=(',', ':')).encode())
+    # Seed the cache with what was just written instead of forcing a re-read
+    # and re-parse. The fresh list object is deliberate: the identity-
+    # validated indexes see a new source and rebuild.
+    _json_cache['data_lake/calendar.json'] = (
+        os.stat('data_lake/calendar.json').st_mtime_ns,
+        {"calendar_events": list(events)},
+    )
+
+def _attendee_keys(event: Dict[str, Any]) -> List[str]:
+    keys = set()
+    for att in event['attendees']:
+        keys.add(att['email'].lower())
+        keys.add(att['name'].lower())
+    return list(keys)
 
 def search_calendar_events(query: str, attendee: Optional[str] = None, location: Optional[str] = None) -> List[Dict[str, Any]]:
     events = load_calendar()
+    blobs = _search_blobs('calendar_text', load_calendar,
+                          lambda ev: (ev['title'] + "\n" + ev.get('description', '')).lower())
     results = []
-    
+
+    q = query.lower()
+    loc = location.lower() if location is not None else None
+
+    # Resolve the attendee filter once against the distinct email/name keys
+    # (same partial-match union as get_emails_by_sender) so the loop does a
+    # set lookup instead of walking every event's attendee list
+    attendee_ok = None
+    if attendee is not None:
+        a = attendee.lower()
+        by_attendee = _facet_index('events_by_attendee', load_calendar, _attendee_keys)
+        attendee_ok = {ev['id'] for key, bucket in by_attendee.items()
+                       if a in key for ev in bucket}
+        if not attendee_ok:
+            return []
+
     for event in events:
-        if query.lower() in event['title'].lower() or query.lower() in event.get('description', '').lower():
-            if attendee is None or any(attendee.lower() in att['email'].lower() or attendee.lower() in att['name'].lower() for att in event['attendees']):
-                if location is None or (event.get('location') and location.lower() in event['location'].lower()):
+        if q in blobs[event['id']]:
+            if attendee_ok is None or event['id'] in attendee_ok:
+                if loc is None or (event.get('location') and loc in event['location'].lower()):
                     results.append(event)
-    
+
     return results
 
-def get_calendar_by_date(date: str) -> List[Dict[str, Any]]:
+# Per-date buckets and start-sorted spans over the calendar, rebuilt whenever
+# load_calendar hands back a different list (i.e. after a write)
+_date_bucket_cache = {"source": None, "by_date": None}
+_span_cache = {"source": None, "starts": None, "entries": None, "max_ends": None}
+
+def _calendar_by_date() -> Dict[str, List[Dict[str, Any]]]:
     events = load_calendar()
-    results = []
-    
-    for event in events:
-        event_date = event['start_time'].split('T')[0]
-        if event_date == date:
-            results.append(event)
-    
-    return sorted(results, key=lambda x: x['start_time'])
+    if _date_bucket_cache["source"] is not events:
+        with _index_lock:
+            if _date_bucket_cache["source"] is not events:
+                by_date = defaultdict(list)
+                for event in events:
+                    by_date[event['start_time'].split('T')[0]].append(event)
+                for bucket in by_date.values():
+                    bucket.sort(key=lambda x: x['start_time'])
+                _date_bucket_cache["by_date"] = dict(by_date)
+                _date_bucket_cache["source"] = events
+    return _date_bucket_cache["by_date"]
+
+def _event_span(event: Dict[str, Any]) -> Any:
+    return (_iso_to_epoch(event['start_time']), _iso_to_epoch(event['end_time']))
+
+def _calendar_spans():
+    """Every event's (start, end) as epoch ints, parsed once per calendar
+    version and shared by all range/overlap queries."""
+    return _derived_index('calendar_spans', load_calendar, _event_span, validate=True)
+
+def _calendar_sorted_spans():
+    events = load_calendar()
+    if _span_cache["source"] is not events:
+        # Resolve the shared spans before taking the non-reentrant lock
+        spanned, spans = _calendar_spans()
+        with _index_lock:
+            if _span_cache["source"] is not events:
+                entries = sorted(
+                    (span[0], span[1], pos, event)
+                    for pos, (event, span) in enumerate(zip(spanned, spans))
+                )
+                _span_cache["entries"] = entries
+                _span_cache["starts"] = [entry[0] for entry in entries]
+                # Running max of end times, the augmentation an interval tree
+                # keeps per node: if max_ends[i] <= s, nothing in the first
+                # i+1 start-sorted entries can overlap a query starting at s
+                max_ends = []
+                running = 0
+                for entry in entries:
+                    if entry[1] > running:
+                        running = entry[1]
+                    max_ends.append(running)
+                _span_cache["max_ends"] = max_ends
+                _span_cache["source"] = spanned
+    return _span_cache["starts"], _span_cache["entries"], _span_cache["max_ends"]
+
+# Per-date busy intervals, parsed to naive datetimes and overlap-merged once
+# per calendar version: a free-slot query then walks disjoint intervals with
+# no per-event strptime. Touching intervals are kept separate so the gap
+# arithmetic below behaves exactly like the event cursor it replaced.
+_busy_cache = {"source": None, "by_date": None}
+
+def _epoch_naive(epoch: int) -> datetime:
+    """Naive UTC wall time for an epoch, matching what strptime of the
+    'Z'-stripped data-lake timestamps produced."""
+    return datetime.fromtimestamp(epoch, timezone.utc).replace(tzinfo=None)
+
+def _calendar_busy_by_date():
+    events = load_calendar()
+    if _busy_cache["source"] is not events:
+        # Resolve the date buckets and shared epoch spans before taking the
+        # lock: both helpers grab _index_lock and the lock is not reentrant
+        by_date = _calendar_by_date()
+        spanned, spans = _calendar_spans()
+        span_by_id = {event['id']: span for event, span in zip(spanned, spans)}
+        with _index_lock:
+            if _busy_cache["source"] is not events:
+                busy = {}
+                for date, day_events in by_date.items():
+                    # Merge on the already-parsed epoch ints; only the merged
+                    # boundaries get promoted to datetime objects
+                    merged = []
+                    for event in day_events:
+                        start, end = span_by_id[event['id']]
+                        if merged and start < merged[-1][1]:
+                            if end > merged[-1][1]:
+                                merged[-1][1] = end
+                        else:
+                            merged.append([start, end])
+                    busy[date] = [(_epoch_naive(s), _epoch_naive(e)) for s, e in merged]
+                _busy_cache["by_date"] = busy
+                _busy_cache["source"] = events
+    return _busy_cache["by_date"]
+
+def get_calendar_by_date(date: str) -> List[Dict[str, Any]]:
+    return _calendar_by_date().get(date, [])
 
 def check_time_availability(start_time: str, end_time: str) -> Dict[str, Any]:
-    events = load_calendar()
-    conflicts = []
-    
-    for event in events:
-        # Check for overlap
-        if (start_time < event['end_time'] and end_time > event['start_time']):
-            conflicts.append(event)
-    
+    starts, entries, max_ends = _calendar_sorted_spans()
+    s, e = _iso_to_epoch(start_time), _iso_to_epoch(end_time)
+
+    # Events starting at/after the query end can't conflict; bisect prunes
+    # them. The max-end augmentation answers the common free-slot probe in
+    # O(log n): if nothing before the cutoff ends after the query start,
+    # there is no conflict and no scan. Otherwise the remaining spans are
+    # checked for overlap and conflicts are reported in file order, as before.
+    cut = bisect.bisect_left(starts, e)
+    if cut == 0 or max_ends[cut - 1] <= s:
+        conflicts = []
+    else:
+        hits = [(pos, event) for _, event_end, pos, event in entries[:cut] if event_end > s]
+        hits.sort()
+        conflicts = [event for _, event in hits]
+
     return {
         "is_free": len(conflicts) == 0,
         "conflicts": conflicts,
@@ -48,38 +255,45 @@ def check_time_availability(start_time: str, end_time: str) -> Dict[str, Any]:
     }
 
 def get_calendar_event_by_id(event_id: str) -> Optional[Dict[str, Any]]:
-    events = load_calendar()
-    
-    for event in events:
-        if event['id'] == event_id:
-            return event
-    
-    return None
+    # Misses (e.g. hallucinated ids like cal_event_999) cost the same single
+    # dict probe as hits; validate=True rebuilds after calendar writes
+    return _id_index('calendar_events', load_calendar, 'id').get(event_id)
 
 def get_events_by_timeframe(start_time: str, end_time: str) -> List[Dict[str, Any]]:
-    events = load_calendar()
-    results = []
-    
-    for event in events:
-        # Check if event overlaps with the timeframe
-        if event['start_time'] < end_time and event['end_time'] > start_time:
-            results.append(event)
-    
-    return sorted(results, key=lambda x: x['start_time'])
-
-def create_calendar_event(title: str, start_time: str, end_time: str, description: str = "", 
-                         location: Optional[str] = None, attendees: Optional[List[Dict[str, str]]] = None) -> Dict[str, Any]:
-    events = load_calendar()
-    
+    starts, entries, _ = _calendar_sorted_spans()
+    s, e = _iso_to_epoch(start_time), _iso_to_epoch(end_time)
+
+    # Events starting at/after the query end can't overlap; bisect prunes
+    # them, the rest are kept if they end after the query start. Ties on
+    # start_time stay in file order, as the stable sort here always produced.
+    hits = [(start, pos, event)
+            for start, event_end, pos, event in entries[:bisect.bisect_left(starts, e)]
+            if event_end > s]
+    hits.sort(key=lambda h: (h[0], h[1]))
+    return [event for _, _, event in hits]
+
+# Highest cal_event_ sequence number, recomputed only when the calendar was
+# replaced from outside this process's writes (identity mismatch); back-to-
+# back creates just increment it instead of re-scanning every id
+_event_seq = {"source": None, "next": 1}
+
+def _next_event_id(events: List[Dict[str, Any]]) -> str:
     # Generate new ID
-    existing_ids = [int(event['id'].split('_')[-1]) for event in events if event['id'].startswith('cal_event_')]
-    new_id = f"cal_event_{max(existing_ids) + 1:03d}" if existing_ids else "cal_event_001"
-    
+    if _event_seq["source"] is not events:
+        existing_ids = [int(event['id'].split('_')[-1]) for event in events if event['id'].startswith('cal_event_')]
+        _event_seq["next"] = max(existing_ids) + 1 if existing_ids else 1
+        _event_seq["source"] = events
+    new_id = f"cal_event_{_event_seq['next']:03d}"
+    _event_seq["next"] += 1
+    return new_id
+
+def _build_event(new_id: str, title: str, start_time: str, end_time: str, description: str,
+                 location: Optional[str], attendees: Optional[List[Dict[str, str]]]) -> Dict[str, Any]:
     # Default attendees to just the user
     if attendees is None:
         attendees = [{"email": "aman.priyanshu@company.com", "name": "Aman Priyanshu", "response": "accepted", "organizer": True}]
     
-    new_event = {
+    return {
         "id": new_id,
         "title": title,
         "description": description,
@@ -91,23 +305,60 @@ def create_calendar_event(title: str, start_time: str, end_time: str, descriptio
         "created_at": "2024-01-19T12:00:00Z",  # Current time in real implementation
         "recurring": False
     }
-    
+
+def create_calendar_event(title: str, start_time: str, end_time: str, description: str = "", 
+                         location: Optional[str] = None, attendees: Optional[List[Dict[str, str]]] = None) -> Dict[str, Any]:
+    events = load_calendar()
+    new_event = _build_event(_next_event_id(events), title, start_time, end_time,
+                             description, location, attendees)
     events.append(new_event)
     save_calendar(events)
+    _event_seq["source"] = load_calendar()
     
     return new_event
 
+def create_calendar_events(events_to_create: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Create several events with one serialize-and-write instead of one full
+    calendar rewrite per event. Each spec needs title/start_time/end_time and
+    may carry description, location and attendees, as in create_calendar_event."""
+    events = load_calendar()
+    created = []
+    for spec in events_to_create:
+        new_event = _build_event(_next_event_id(events), spec['title'],
+                                 spec['start_time'], spec['end_time'],
+                                 spec.get('description', ''), spec.get('location'),
+                                 spec.get('attendees'))
+        events.append(new_event)
+        created.append(new_event)
+    if created:
+        save_calendar(events)
+        _event_seq["source"] = load_calendar()
+    
+    return created
+
 def find_free_time_slots(start_date: str, end_date: str, duration_minutes: int, 
                         working_hours_only: bool = True) -> List[Dict[str, str]]:
     from datetime import datetime, timedelta
     
-    events = get_events_by_timeframe(f"{start_date}T00:00:00Z", f"{end_date}T23:59:59Z")
+    # Sweep the preindexed per-date busy intervals (start-sorted and
+    # overlap-merged) instead of re-parsing every event per query
+    busy_by_date = _calendar_busy_by_date()
     free_slots = []
-    
+    min_gap = duration_minutes * 60
+
+    def _slot(gap_start, gap_end, gap_seconds):
+        # These datetimes carry no microseconds, so isoformat() emits the
+        # same second-precision shape strftime('%Y-%m-%dT%H:%M:%S') did
+        return {
+            "start_time": gap_start.isoformat() + "Z",
+            "end_time": gap_end.isoformat() + "Z",
+            "duration_minutes": int(gap_seconds / 60)
+        }
+
     # Parse dates without timezone info first, then add UTC
     current_date = datetime.strptime(start_date, '%Y-%m-%d')
     end_date_dt = datetime.strptime(end_date, '%Y-%m-%d')
-    
+
     while current_date <= end_date_dt:
         if working_hours_only:
             day_start = current_date.replace(hour=9, minute=0, second=0)
@@ -116,143 +367,258 @@ def find_free_time_slots(start_date: str, end_date: str, duration_minutes: int,
             day_start = current_date.replace(hour=0, minute=0, second=0)
             day_end = current_date.replace(hour=23, minute=59, second=59)
         
-        # Get events for this day
-        day_events = [e for e in events if e['start_time'].startswith(current_date.strftime('%Y-%m-%d'))]
-        day_events.sort(key=lambda x: x['start_time'])
-        
-        # Find gaps between events
+        # Find gaps between this day's busy intervals
         current_time = day_start
-        for event in day_events:
-            # Parse event time and make it timezone-naive for comparison
-            event_start = datetime.strptime(event['start_time'].replace('Z', ''), '%Y-%m-%dT%H:%M:%S')
-            event_end = datetime.strptime(event['end_time'].replace('Z', ''), '%Y-%m-%dT%H:%M:%S')
+        for busy_start, busy_end in busy_by_date.get(current_date.date().isoformat(), ()):
+            gap = (busy_start - current_time).total_seconds()
+            if gap >= min_gap:
+                free_slots.append(_slot(current_time, busy_start, gap))
             
-            # Check if there's a gap before this event
-            if (event_start - current_time).total_seconds() >= duration_minutes * 60:
-                free_slots.append({
-                    "start_time": current_time.strftime('%Y-%m-%dT%H:%M:%S') + "Z",
-                    "end_time": event_start.strftime('%Y-%m-%dT%H:%M:%S') + "Z",
-                    "duration_minutes": int((event_start - current_time).total_seconds() / 60)
-                })
-            
-            # Move current_time to after this event
-            current_time = max(current_time, event_end)
+            # Move current_time past this busy block
+            current_time = max(current_time, busy_end)
         
         # Check time after last event until end of day
-        if (day_end - current_time).total_seconds() >= duration_minutes * 60:
-            free_slots.append({
-                "start_time": current_time.strftime('%Y-%m-%dT%H:%M:%S') + "Z",
-                "end_time": day_end.strftime('%Y-%m-%dT%H:%M:%S') + "Z",
-                "duration_minutes": int((day_end - current_time).total_seconds() / 60)
-            })
+        gap = (day_end - current_time).total_seconds()
+        if gap >= min_gap:
+            free_slots.append(_slot(current_time, day_end, gap))
         
         current_date += timedelta(days=1)
     
     return free_slots
 def load_code_contexts():
-    with open('data_lake/code_contexts.json', 'r') as f:
-        return json.load(f)['code_context']
+    return _cached_json('data_lake/code_contexts.json')['code_context']
 
 def load_emails():
-    with open('data_lake/emails.json', 'r') as f:
-        return json.load(f)['emails']
+    return _cached_json('data_lake/emails.json')['emails']
 
 def load_github_repo():
-    with open('data_lake/github_repo_alignment.json', 'r') as f:
-        return json.load(f)
+    return _cached_json('data_lake/github_repo_alignment.json')
 
 def load_filesystem():
-    with open('data_lake/local_filesystem.json', 'r') as f:
-        return json.load(f)
+    return _cached_json('data_lake/local_filesystem.json')
 
 def load_restaurants():
-    with open('data_lake/restaurant.json', 'r') as f:
-        return json.load(f)['restaurants']
+    return _cached_json('data_lake/restaurant.json')['restaurants']
 
 def load_system_logs():
-    with open('data_lake/system_logs.json', 'r') as f:
-        return json.load(f)
+    return _cached_json('data_lake/system_logs.json')
 
 def load_transactions():
-    with open('data_lake/transactions.json', 'r') as f:
-        return json.load(f)['finance_transactions']
+    return _cached_json('data_lake/transactions.json')['finance_transactions']
+
+def multi_pattern_search(patterns: List[str], records: List[Dict[str, Any]], fields: List[str]) -> Dict[str, List[int]]:
+    """Batch substring search: scan each record once for every pattern.
+
+    Lowercases each record's searchable text a single time and checks the whole
+    pattern set against it, instead of re-scanning the corpus per query. Uses a
+    pyahocorasick automaton for the scan when the package is available.
+    """
+    patterns_lc = [p.lower() for p in patterns]
+    hits: Dict[str, List[int]] = {p: [] for p in patterns_lc}
+
+    try:
+        import ahocorasick
+        automaton = ahocorasick.Automaton()
+        for i, pattern in enumerate(patterns_lc):
+            automaton.add_word(pattern, i)
+        automaton.make_automaton()
+    except ImportError:
+        automaton = None
+
+    for idx, record in enumerate(records):
+        text = " ".join(str(record.get(f, '')) for f in fields).lower()
+        if automaton is not None:
+            for i in {i for _, i in automaton.iter(text)}:
+                hits[patterns_lc[i]].append(idx)
+        else:
+            for pattern in patterns_lc:
+                if pattern in text:
+                    hits[pattern].append(idx)
+
+    return hits
+
+# Searchable blobs: the text fields a search tool matches against, lowercased
+# and newline-joined once per record and keyed by record id. The per-call cost
+# of a query becomes one C-level substring check per candidate instead of
+# lowercasing every field on every call. Token/intersection indexes were
+# considered and rejected: these tools promise substring semantics ("auth"
+# must match "oauth2"), which postings intersections cannot preserve.
+def _search_blobs(name: str, loader: Callable[[], List[Dict[str, Any]]],
+                  blob_fn: Callable[[Dict[str, Any]], str], key: str = 'id') -> Dict[str, str]:
+    records = loader()
+    entry = _blob_caches.get(name)
+    if entry is None or entry[0] is not records:
+        with _index_lock:
+            entry = _blob_caches.get(name)
+            if entry is None or entry[0] is not records:
+                entry = (records, {r[key]: blob_fn(r) for r in records})
+                _blob_caches[name] = entry
+    return entry[1]
+
+_blob_caches: Dict[str, Any] = {}
+
+# Trigram postings over the search blobs: every 3-char shingle maps to the set
+# of record keys whose blob contains it. A record containing the query must
+# contain all of the query's trigrams, so intersecting the postings yields a
+# guaranteed superset of matches; the substring check then verifies survivors.
+# Queries shorter than 3 chars skip the prefilter and scan the blobs directly.
+_trigram_caches: Dict[str, Any] = {}
+
+def _trigram_index(name: str, loader: Callable[[], List[Dict[str, Any]]],
+                   blobs: Dict[str, str]) -> Dict[str, frozenset]:
+    records = loader()
+    entry = _trigram_caches.get(name)
+    if entry is None or entry[0] is not records:
+        postings = defaultdict(set)
+        for key, blob in blobs.items():
+            for i in range(len(blob) - 2):
+                postings[blob[i:i + 3]].add(key)
+        with _index_lock:
+            entry = _trigram_caches.get(name)
+            if entry is None or entry[0] is not records:
+                entry = (records, dict(postings))
+                _trigram_caches[name] = entry
+    return entry[1]
+
+def _trigram_candidates(name: str, loader: Callable[[], List[Dict[str, Any]]],
+                        blobs: Dict[str, str], q: str) -> Optional[frozenset]:
+    """Superset of blob keys that can contain q, or None for a full scan."""
+    if len(q) < 3:
+        return None
+    postings = _trigram_index(name, loader, blobs)
+    sets = []
+    for i in range(len(q) - 2):
+        p = postings.get(q[i:i + 3])
+        if p is None:
+            return frozenset()
+        sets.append(p)
+    sets.sort(key=len)
+    result = sets[0]
+    for p in sets[1:]:
+        result = result & p
+    return result
 
 def search_code_issues(query: str, status: Optional[str] = None, assignee: Optional[str] = None) -> List[Dict[str, Any]]:
-    contexts = load_code_contexts()
-    results = []
-    
-    for context in contexts:
-        if query.lower() in context['issue_title'].lower() or query.lower() in context['discussion'].lower():
-            if status is None or context['status'] == status:
-                if assignee is None or context['assignee'] == assignee:
-                    results.append(context)
-    
-    return results
+    # Narrow candidates through the most selective equality facet first
+    if status is not None:
+        contexts = _facet_index('issues_by_status', load_code_contexts, lambda c: [c['status']]).get(status, [])
+        if assignee is not None:
+            contexts = [c for c in contexts if c['assignee'] == assignee]
+    elif assignee is not None:
+        contexts = _facet_index('issues_by_assignee', load_code_contexts, lambda c: [c['assignee']]).get(assignee, [])
+    else:
+        contexts = load_code_contexts()
+
+    blobs = _search_blobs('issue_text', load_code_contexts,
+                          lambda c: (c['issue_title'] + "\n" + c['discussion']).lower())
+    q = query.lower()
+    candidates = _trigram_candidates('issue_text', load_code_contexts, blobs, q)
+    if candidates is None:
+        return [c for c in contexts if q in blobs[c['id']]]
+    return [c for c in contexts if c['id'] in candidates and q in blobs[c['id']]]
 
 def get_issue_by_id(issue_id: str) -> Optional[Dict[str, Any]]:
-    contexts = load_code_contexts()
-    
-    for context in contexts:
-        if context['id'] == issue_id:
-            return context
-    
-    return None
+    return _id_index('issues', load_code_contexts, 'id').get(issue_id)
+
+def get_issues_by_ids(issue_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+    # Batch form: agents often request several ids back to back, and one call
+    # amortizes the dispatch over N dict probes. Unknown ids yield None in
+    # place, same as the single-id tool.
+    index = _id_index('issues', load_code_contexts, 'id')
+    return [index.get(issue_id) for issue_id in issue_ids]
+
+def _location_suffixes(context: Dict[str, Any]) -> List[str]:
+    # Every '/'-anchored suffix of every location (a/b/c.py, b/c.py, c.py),
+    # deduped per issue so the facet buckets stay free of repeats
+    suffixes = set()
+    for location in context['locations']:
+        parts = location.split('/')
+        for i in range(len(parts)):
+            suffixes.add('/'.join(parts[i:]))
+    return list(suffixes)
 
 def get_issues_by_location(file_path: str) -> List[Dict[str, Any]]:
     contexts = load_code_contexts()
-    results = []
-    
-    for context in contexts:
-        for location in context['locations']:
-            if file_path in location:
-                results.append(context)
-                break
-    
-    return results
+    blobs = _search_blobs('issue_location_text', load_code_contexts,
+                          lambda c: "\n".join(c['locations']))
+    # Exact path or path tail: the suffix facet confirms those issues in one
+    # lookup (a suffix hit is always a substring hit, never the reverse)
+    exact = _facet_index('issues_by_path_suffix', load_code_contexts,
+                         _location_suffixes).get(file_path)
+    confirmed = {c['id'] for c in exact} if exact else set()
+    # Anything the suffix index can't see (mid-path fragments, partial file
+    # names) still has the same substring semantics as before; the trigram
+    # candidates bound that scan to plausible blobs
+    candidates = _trigram_candidates('issue_location_text', load_code_contexts,
+                                     blobs, file_path)
+    if candidates is None:
+        return [c for c in contexts
+                if c['id'] in confirmed or file_path in blobs[c['id']]]
+    return [c for c in contexts
+            if c['id'] in confirmed
+            or (c['id'] in candidates and file_path in blobs[c['id']])]
 
 def search_emails(query: str, sender: Optional[str] = None, read_status: Optional[bool] = None) -> List[Dict[str, Any]]:
-    emails = load_emails()
-    results = []
-    
-    for email in emails:
-        if query.lower() in email['subject'].lower() or query.lower() in email['body'].lower():
-            if sender is None or sender.lower() in email['from'].lower():
-                if read_status is None or email.get('read') == read_status:
-                    results.append(email)
-    
-    return results
+    if read_status is not None:
+        emails = _facet_index('emails_by_read', load_emails, lambda e: [e.get('read')]).get(read_status, [])
+    else:
+        emails = load_emails()
+
+    if sender is not None:
+        s = sender.lower()
+        emails = [e for e in emails if s in e['from'].lower()]
+
+    blobs = _search_blobs('email_text', load_emails,
+                          lambda e: (e['subject'] + "\n" + e['body']).lower())
+    q = query.lower()
+    candidates = _trigram_candidates('email_text', load_emails, blobs, q)
+    if candidates is None:
+        return [e for e in emails if q in blobs[e['id']]]
+    return [e for e in emails if e['id'] in candidates and q in blobs[e['id']]]
 
 def get_email_by_id(email_id: str) -> Optional[Dict[str, Any]]:
-    emails = load_emails()
-    
-    for email in emails:
-        if email['id'] == email_id:
-            return email
-    
-    return None
+    return _id_index('emails', load_emails, 'id').get(email_id)
+
+def get_emails_by_ids(email_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+    index = _id_index('emails', load_emails, 'id')
+    return [index.get(email_id) for email_id in email_ids]
+
+def _bucket_union(index: Dict[Any, List[Dict[str, Any]]], needle: str,
+                  records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # Union of the buckets whose key contains the needle. A single matching
+    # bucket is already in file order; with several, bucket concatenation
+    # would follow key-discovery order, so re-emit from the records list
+    matched = [bucket for key, bucket in index.items() if needle in key]
+    if not matched:
+        return []
+    if len(matched) == 1:
+        return matched[0]
+    allowed = {id(r) for bucket in matched for r in bucket}
+    return [r for r in records if id(r) in allowed]
 
 def get_emails_by_sender(sender: str) -> List[Dict[str, Any]]:
-    emails = load_emails()
-    results = []
-    
-    for email in emails:
-        if sender.lower() in email['from'].lower():
-            results.append(email)
-    
-    return results
+    # Group emails by lowercased sender once; the partial match then scans the
+    # handful of distinct senders instead of every email
+    by_sender = _facet_index('emails_by_sender', load_emails, lambda e: [e['from'].lower()])
+    return _bucket_union(by_sender, sender.lower(), load_emails())
+
+def _load_repo_files():
+    return load_github_repo()['files']
 
 def search_repo_files(query: str, language: Optional[str] = None, contributor: Optional[str] = None) -> List[Dict[str, Any]]:
-    repo_data = load_github_repo()
-    files = repo_data['files']
-    results = []
-    
-    for file in files:
-        if query.lower() in file['path'].lower():
-            if language is None or file['language'].lower() == language.lower():
-                if contributor is None or contributor.lower() in [c.lower() for c in file['contributors']]:
-                    results.append(file)
-    
-    return results
+    if language is not None:
+        files = _facet_index('repo_files_by_language', _load_repo_files, lambda f: [f['language'].lower()]).get(language.lower(), [])
+        if contributor is not None:
+            c = contributor.lower()
+            files = [f for f in files if c in [x.lower() for x in f['contributors']]]
+    elif contributor is not None:
+        files = _facet_index('repo_files_by_contributor', _load_repo_files, lambda f: [c.lower() for c in f['contributors']]).get(contributor.lower(), [])
+    else:
+        files = _load_repo_files()
+
+    blobs = _search_blobs('repo_paths', _load_repo_files, lambda f: f['path'].lower(), key='path')
+    q = query.lower()
+    return [f for f in files if q in blobs[f['path']]]
 
 def get_file_by_path(file_path: str) -> Optional[Dict[str, Any]]:
     repo_data = load_github_repo()
@@ -274,18 +640,23 @@ def search_dependencies(package_name: str) -> Optional[Dict[str, Any]]:
     
     return None
 
+def _load_local_files():
+    return load_filesystem()['files']
+
 def search_local_files(query: str, extension: Optional[str] = None, directory: Optional[str] = None) -> List[Dict[str, Any]]:
-    fs_data = load_filesystem()
-    files = fs_data['files']
-    results = []
-    
-    for file in files:
-        if query.lower() in file['path'].lower():
-            if extension is None or file['extension'].lower() == extension.lower():
-                if directory is None or directory.lower() in file['path'].lower():
-                    results.append(file)
-    
-    return results
+    if extension is not None:
+        files = _facet_index('local_files_by_extension', _load_local_files, lambda f: [f['extension'].lower()]).get(extension.lower(), [])
+    else:
+        files = _load_local_files()
+
+    blobs = _search_blobs('local_paths', _load_local_files, lambda f: f['path'].lower(), key='path')
+
+    if directory is not None:
+        d = directory.lower()
+        files = [f for f in files if d in blobs[f['path']]]
+
+    q = query.lower()
+    return [f for f in files if q in blobs[f['path']]]
 
 def get_local_file_by_path(file_path: str) -> Optional[Dict[str, Any]]:
     fs_data = load_filesystem()
@@ -308,98 +679,190 @@ def get_directory_info(dir_path: str) -> Optional[Dict[str, Any]]:
     return None
 
 def search_restaurants(cuisine: Optional[str] = None, area: Optional[str] = None, dietary: Optional[str] = None) -> List[Dict[str, Any]]:
-    restaurants = load_restaurants()
-    results = []
-    
-    for restaurant in restaurants:
-        if cuisine is None or restaurant['cuisine'].lower() == cuisine.lower():
-            if area is None or restaurant['area'].lower() == area.lower():
-                if dietary is None or restaurant.get(dietary, False):
-                    results.append(restaurant)
-    
-    return results
+    if cuisine is not None:
+        restaurants = _facet_index('restaurants_by_cuisine', load_restaurants, lambda r: [r['cuisine'].lower()]).get(cuisine.lower(), [])
+        if area is not None:
+            a = area.lower()
+            restaurants = [r for r in restaurants if r['area'].lower() == a]
+    elif area is not None:
+        restaurants = _facet_index('restaurants_by_area', load_restaurants, lambda r: [r['area'].lower()]).get(area.lower(), [])
+    else:
+        restaurants = load_restaurants()
+
+    if dietary is not None:
+        restaurants = [r for r in restaurants if r.get(dietary, False)]
+
+    # Read-only view: either a fresh comprehension or the shared facet bucket
+    return restaurants
 
 def get_restaurant_by_id(restaurant_id: str) -> Optional[Dict[str, Any]]:
+    return _id_index('restaurants', load_restaurants, 'id').get(restaurant_id)
+
+def _iso_to_epoch(ts: str) -> int:
+    """Epoch seconds for the ISO-8601 'Z' timestamps used across the data lake."""
+    return int(datetime.fromisoformat(ts.replace('Z', '+00:00')).timestamp())
+
+# Derived-column indexes: records in load order alongside one derived key per
+# record, computed once (timestamps parsed to epoch seconds, joined searchable
+# blobs, ...) so per-call work is a plain comparison per row.
+_derived_indexes: Dict[str, Any] = {}
+
+def _derived_index(name: str, loader: Callable[[], List[Dict[str, Any]]],
+                   key_fn: Callable[[Dict[str, Any]], Any], validate: bool = False):
+    index = _derived_indexes.get(name)
+    if index is not None and validate and loader() is not index[0]:
+        index = None
+    if index is None:
+        with _index_lock:
+            index = _derived_indexes.get(name)
+            if index is None or (validate and loader() is not index[0]):
+                records = loader()
+                index = (records, [key_fn(r) for r in records])
+                _derived_indexes[name] = index
+    return index
+
+# Primary-key indexes: id -> record, so point lookups (including repeated
+# misses on hallucinated ids) are one hash probe instead of a list scan.
+# Always revalidated against the loader's object identity: the loaders are
+# mtime-cached, so the check is a dict probe, and a rewritten fixture (the
+# calendar after a save, or any file edited on disk) rebuilds the index.
+_id_indexes: Dict[str, Any] = {}
+
+def _id_index(name: str, loader: Callable[[], List[Dict[str, Any]]], key: str):
+    records = loader()
+    index = _id_indexes.get(name)
+    if index is None or index[0] is not records:
+        with _index_lock:
+            index = _id_indexes.get(name)
+            if index is None or index[0] is not records:
+                index = (records, {r[key]: r for r in records})
+                _id_indexes[name] = index
+    return index[1]
+
+_distance_index: Dict[str, Any] = {}
+
+def _restaurants_distance_index():
+    """Restaurants sorted by distance once, with a parallel key list for
+    bisect. Revalidated against the cached loader object like the other
+    indexes, so an on-disk change to the fixture rebuilds the ordering."""
     restaurants = load_restaurants()
-    
-    for restaurant in restaurants:
-        if restaurant['id'] == restaurant_id:
-            return restaurant
-    
-    return None
+    index = _distance_index.get('restaurants')
+    if index is None or index[0] is not restaurants:
+        with _index_lock:
+            index = _distance_index.get('restaurants')
+            if index is None or index[0] is not restaurants:
+                ordered = sorted(restaurants, key=lambda r: r['distance_km'])
+                index = (restaurants, ordered, [r['distance_km'] for r in ordered])
+                _distance_index['restaurants'] = index
+    return index
 
 def find_restaurants_by_distance(max_distance_km: float) -> List[Dict[str, Any]]:
-    restaurants = load_restaurants()
-    results = []
-    
-    for restaurant in restaurants:
-        if restaurant['distance_km'] <= max_distance_km:
-            results.append(restaurant)
-    
-    return sorted(results, key=lambda x: x['distance_km'])
+    _, ordered, distances = _restaurants_distance_index()
+    return ordered[:bisect.bisect_right(distances, max_distance_km)]
+
+def _load_logs():
+    return load_system_logs()['logs']
+
+def _intersect_buckets(buckets, extra_masks=()):
+    # Stdlib stand-in for chained vectorized masks: iterate the smallest
+    # bucket (every bucket is in file order, so output order is preserved)
+    # and test the rest by object identity instead of re-comparing fields
+    buckets = sorted(buckets, key=len)
+    base = buckets[0]
+    masks = [{id(r) for r in b} for b in buckets[1:]]
+    masks.extend(extra_masks)
+    if not masks:
+        return base
+    return [r for r in base if all(id(r) in m for m in masks)]
 
 def search_system_logs(service: Optional[str] = None, level: Optional[str] = None, error_code: Optional[str] = None) -> List[Dict[str, Any]]:
-    log_data = load_system_logs()
-    logs = log_data['logs']
-    results = []
-    
-    for log in logs:
-        if service is None or log['service'].lower() == service.lower():
-            if level is None or log['level'].lower() == level.lower():
-                if error_code is None or log.get('error_code', '').lower() == error_code.lower():
-                    results.append(log)
-    
-    return results
+    buckets = []
+    if service is not None:
+        buckets.append(_facet_index('logs_by_service', _load_logs, lambda l: [l['service'].lower()]).get(service.lower(), []))
+    if level is not None:
+        buckets.append(_facet_index('logs_by_level', _load_logs, lambda l: [l['level'].lower()]).get(level.lower(), []))
+    if error_code is not None:
+        buckets.append(_facet_index('logs_by_error_code', _load_logs, lambda l: [l.get('error_code', '').lower()]).get(error_code.lower(), []))
+    if not buckets:
+        return _load_logs()
+
+    # Read-only view: either a fresh comprehension or the shared facet bucket
+    return _intersect_buckets(buckets)
+
+def _load_metrics():
+    return load_system_logs()['metrics']
 
 def get_metrics_by_service(service: str) -> List[Dict[str, Any]]:
-    log_data = load_system_logs()
-    metrics = log_data['metrics']
-    results = []
-    
-    for metric in metrics:
-        if service.lower() in metric['service'].lower():
-            results.append(metric)
-    
-    return results
+    # Partial match over the handful of distinct service names, like
+    # get_emails_by_sender: union the buckets whose key contains the query
+    by_service = _facet_index('metrics_by_service', _load_metrics, lambda m: [m['service'].lower()])
+    return _bucket_union(by_service, service.lower(), _load_metrics())
+
+# Timestamp-sorted views for range queries: (sorted epoch keys, matching
+# (epoch, position) entries). Neither fixture is stored in time order, so hits
+# carry their original positions and results are re-sorted into file order.
+_sorted_time_caches: Dict[str, Any] = {}
+
+def _time_sorted(name: str, loader: Callable[[], List[Dict[str, Any]]],
+                 ts_fn: Callable[[Dict[str, Any]], int]):
+    records = loader()
+    entry = _sorted_time_caches.get(name)
+    if entry is None or entry[0] is not records:
+        with _index_lock:
+            entry = _sorted_time_caches.get(name)
+            if entry is None or entry[0] is not records:
+                entries = sorted((ts_fn(r), pos) for pos, r in enumerate(records))
+                entry = (records, [ts for ts, _ in entries], entries)
+                _sorted_time_caches[name] = entry
+    return entry
+
+def _range_query(name: str, loader: Callable[[], List[Dict[str, Any]]],
+                 ts_fn: Callable[[Dict[str, Any]], int],
+                 start_time: str, end_time: str) -> List[Dict[str, Any]]:
+    """Records whose point timestamp falls in [start_time, end_time], in file
+    order. Shared fast path for the timeframe tools; calendar events keep
+    their own span index because they match on overlap, not containment."""
+    records, keys, entries = _time_sorted(name, loader, ts_fn)
+    s, e = _iso_to_epoch(start_time), _iso_to_epoch(end_time)
+    window = entries[bisect.bisect_left(keys, s):bisect.bisect_right(keys, e)]
+    return [records[pos] for pos in sorted(pos for _, pos in window)]
 
 def get_logs_by_timeframe(start_time: str, end_time: str) -> List[Dict[str, Any]]:
-    log_data = load_system_logs()
-    logs = log_data['logs']
-    results = []
-    
-    for log in logs:
-        if start_time <= log['timestamp'] <= end_time:
-            results.append(log)
-    
-    return results
+    return _range_query('log_timestamps', _load_logs, lambda l: _iso_to_epoch(l['timestamp']),
+                        start_time, end_time)
 
 def search_transactions(category: Optional[str] = None, employee: Optional[str] = None, card_type: Optional[str] = None) -> List[Dict[str, Any]]:
-    transactions = load_transactions()
-    results = []
-    
-    for transaction in transactions:
-        if category is None or transaction['category'].lower() == category.lower():
-            if employee is None or employee.lower() in transaction['employee'].lower():
-                if card_type is None or transaction['card_type'].lower() == card_type.lower():
-                    results.append(transaction)
-    
-    return results
+    buckets = []
+    if category is not None:
+        buckets.append(_facet_index('transactions_by_category', load_transactions, lambda t: [t['category'].lower()]).get(category.lower(), []))
+    if card_type is not None:
+        buckets.append(_facet_index('transactions_by_card_type', load_transactions, lambda t: [t['card_type'].lower()]).get(card_type.lower(), []))
+
+    masks = []
+    if employee is not None:
+        # Partial match over the distinct employee names, as before; combined
+        # with other filters the union collapses into one identity mask
+        emp = employee.lower()
+        by_employee = _facet_index('transactions_by_employee', load_transactions,
+                                   lambda t: [t['employee'].lower()])
+        matched = [bucket for key, bucket in by_employee.items() if emp in key]
+        if not buckets:
+            return _bucket_union(by_employee, emp, load_transactions())
+        masks.append({id(t) for bucket in matched for t in bucket})
+
+    if not buckets:
+        return load_transactions()
+
+    # Read-only view: either a fresh comprehension or the shared facet bucket
+    return _intersect_buckets(buckets, masks)
 
 def get_transaction_by_id(transaction_id: str) -> Optional[Dict[str, Any]]:
-    transactions = load_transactions()
-    
-    for transaction in transactions:
-        if transaction['transaction_id'] == transaction_id:
-            return transaction
-    
-    return None
+    return _id_index('transactions', load_transactions, 'transaction_id').get(transaction_id)
+
+def get_transactions_by_ids(transaction_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+    index = _id_index('transactions', load_transactions, 'transaction_id')
+    return [index.get(transaction_id) for transaction_id in transaction_ids]
 
 def get_expenses_by_timeframe(start_time: str, end_time: str) -> List[Dict[str, Any]]:
-    transactions = load_transactions()
-    results = []
-    
-    for transaction in transactions:
-        if start_time <= transaction['timestamp'] <= end_time:
-            results.append(transaction)
-    
-    return results
\ No newline at end of file
+    return _range_query('transaction_timestamps', load_transactions,
+                        lambda t: _iso_to_epoch(t['timestamp']), start_time, end_time)
\ No newline at end of file